@@ -1,42 +1,145 @@
 import os
+import errno
 import logging
+import logging.handlers
 import json
+import pickle
 import platform
 import shutil
 import time
-import traceback
-import datetime
 import ctypes
+import uuid
+from ctypes import wintypes
+import threading
+import concurrent.futures
+import itertools
+import functools
 from pathlib import Path
 from typing import Optional
-import winreg
+
+# Optional faster JSON parser
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Names that are never moved into the archive (compared lowercase)
+_SYSTEM_FILES = frozenset({
+    "desktop.ini",
+    "recycle bin",
+    "trash",
+    "$recycle.bin",
+    ".ds_store",  # macOS system file
+    "thumbs.db"    # Windows thumbnail cache
+})
+_RECYCLE_MARKERS = ("$recycle.bin", "recycle bin")
+
+
+@functools.lru_cache(maxsize=256)
+def _is_system_name(name_lower: str) -> bool:
+    """Name-only part of the system file check (recurring names are cached)"""
+    return name_lower in _SYSTEM_FILES
+
+# Resolved special folder paths, keyed on (os_type, folder_name)
+_SPECIAL_FOLDER_CACHE: dict = {}
+_SPECIAL_FOLDER_LOCK = threading.Lock()
+
+# Backoff between attempts to move a file that is in use (seconds)
+_RETRY_DELAYS = (0.05, 0.2, 0.8)
+
+
+def _move_path(src, dst) -> None:
+    """Rename src to dst, copying only when they are on different devices"""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno == errno.EXDEV:
+            shutil.move(src, dst)
+        else:
+            raise
+
+
+# Shell known folder ID for the user's Downloads folder
+FOLDERID_DOWNLOADS = "{374DE290-123F-4565-9164-39C4925E467B}"
+
+
+class _GUID(ctypes.Structure):
+    _fields_ = [
+        ("Data1", wintypes.DWORD),
+        ("Data2", wintypes.WORD),
+        ("Data3", wintypes.WORD),
+        ("Data4", wintypes.BYTE * 8)
+    ]
+
+
+def _get_known_folder_path(folder_id: str) -> str:
+    """Resolve a known folder with SHGetKnownFolderPath (Windows only)"""
+    guid = _GUID.from_buffer_copy(uuid.UUID(folder_id).bytes_le)
+    get_path = ctypes.windll.shell32.SHGetKnownFolderPath
+    get_path.argtypes = [ctypes.POINTER(_GUID), wintypes.DWORD,
+                         wintypes.HANDLE, ctypes.POINTER(ctypes.c_void_p)]
+    get_path.restype = ctypes.HRESULT
+    out = ctypes.c_void_p()
+    try:
+        # A failing HRESULT raises OSError through the restype
+        get_path(ctypes.byref(guid), 0, None, ctypes.byref(out))
+        return ctypes.wstring_at(out.value)
+    finally:
+        ctypes.windll.ole32.CoTaskMemFree(out)
+
+
+def _dir_size(path: str) -> int:
+    """Total size in bytes of all files below a directory"""
+    total = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    total += _dir_size(entry.path)
+                else:
+                    total += entry.stat(follow_symlinks=False).st_size
+    except Exception:
+        pass
+    return total
+
 
 class FileOrganizer:
     def __init__(self, config_path: str = "config.json"):
         """Initialize the File Organizer with enhanced error handling"""
         try:
             # Set up logging first
+            # File writes are buffered and flushed in batches (or on errors)
+            log_format = '%(asctime)s - %(levelname)s - %(message)s'
+            file_handler = logging.FileHandler('file_organizer.log')
+            file_handler.setFormatter(logging.Formatter(log_format))
             logging.basicConfig(
                 level=logging.INFO,
-                format='%(asctime)s - %(levelname)s - %(message)s',
+                format=log_format,
                 handlers=[
-                    logging.FileHandler('file_organizer.log'),
+                    logging.handlers.MemoryHandler(capacity=1024, target=file_handler),
                     logging.StreamHandler()  # Also print to console
                 ]
             )
-            logging.info("Initializing File Organizer...")
+            logger.info("Initializing File Organizer...")
 
             # Detect OS
             self.os_type = platform.system()
-            logging.info(f"Detected OS: {self.os_type}")
+            logger.info(f"Detected OS: {self.os_type}")
+
+            # Bind the platform-specific folder lookup once
+            if self.os_type == "Windows":
+                self._get_folder = self._get_folder_windows
+            else:
+                self._get_folder = self._get_folder_posix
 
             # Load configuration
             try:
-                with open(config_path, 'r') as f:
-                    self.config = json.load(f)
-                logging.info("Configuration loaded successfully")
+                self.config = self._load_config(Path(config_path))
+                logger.info("Configuration loaded successfully")
             except Exception as e:
-                logging.error(f"Failed to load configuration: {e}")
+                logger.error(f"Failed to load configuration: {e}")
                 raise
 
             # Initialize statistics
@@ -45,247 +148,315 @@ class FileOrganizer:
                 "space_cleared": 0,
                 "errors": 0
             }
+            self._stats_lock = threading.Lock()
+
+            # List the home folder once; folder lookups become dict checks
+            self._home = Path.home()
+            self._home_entries = self._scan_names(self._home)
+            self._onedrive_entries = None
 
             # Verify and get special folders with more detailed logging
             self.desktop_path = self.get_special_folder_path("Desktop")
             self.downloads_path = self.get_special_folder_path("Downloads")
             
             if not self.desktop_path:
-                logging.error("Failed to get Desktop path")
+                logger.error("Failed to get Desktop path")
             else:
-                logging.info(f"Selected Desktop path: {self.desktop_path}")
+                logger.info(f"Selected Desktop path: {self.desktop_path}")
                 
             if not self.downloads_path:
-                logging.error("Failed to get Downloads path")
+                logger.error("Failed to get Downloads path")
             else:
-                logging.info(f"Selected Downloads path: {self.downloads_path}")
+                logger.info(f"Selected Downloads path: {self.downloads_path}")
 
-            logging.info("Initialization complete")
+            logger.info("Initialization complete")
 
         except Exception as e:
-            logging.error(f"Initialization failed: {e}")
-            logging.error(traceback.format_exc())
+            logger.exception(f"Initialization failed: {e}")
             raise
 
-    def get_special_folder_path(self, folder_name: str) -> Optional[str]:
-        """Get the path of special folders with multi-OS support and multiple path checking"""
+    def _load_config(self, config_path: Path) -> dict:
+        """Load the JSON config, reusing a pickled copy while the file is unchanged"""
+        cache_path = config_path.with_name(f".{config_path.name}.pkl")
+        mtime = config_path.stat().st_mtime_ns
         try:
-            if self.os_type == "Windows":
-                possible_paths = []
-                
-                # Add OneDrive path if it exists
-                onedrive_path = os.path.join(str(Path.home()), "OneDrive", folder_name)
-                if os.path.exists(onedrive_path):
-                    possible_paths.append(onedrive_path)
-                    logging.info(f"Found OneDrive {folder_name} path: {onedrive_path}")
-                
-                # Add regular Windows path
-                regular_path = os.path.join(str(Path.home()), folder_name)
-                if os.path.exists(regular_path):
-                    possible_paths.append(regular_path)
-                    logging.info(f"Found regular {folder_name} path: {regular_path}")
-                
-                # For Downloads, also check Windows Registry
-                if folder_name == "Downloads":
-                    try:
-                        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 
-                                          r"Software\Microsoft\Windows\CurrentVersion\Explorer\Shell Folders") as key:
-                            reg_path = winreg.QueryValueEx(key, "{374DE290-123F-4565-9164-39C4925E467B}")[0]
-                            if os.path.exists(reg_path):
-                                possible_paths.append(reg_path)
-                                logging.info(f"Found Registry {folder_name} path: {reg_path}")
-                    except Exception as e:
-                        logging.warning(f"Failed to get Downloads path from registry: {e}")
-                
-                # If we found any valid paths, use the first one
-                if possible_paths:
-                    chosen_path = possible_paths[0]
-                    logging.info(f"Using {folder_name} path: {chosen_path}")
-                    return chosen_path
-                else:
-                    logging.error(f"No valid {folder_name} path found")
-                    return None
-                
-            else:  # macOS and Linux
-                path = str(Path.home() / folder_name)
-                if os.path.exists(path):
-                    logging.info(f"Using {self.os_type} {folder_name} path: {path}")
-                    return path
-                else:
-                    logging.error(f"No valid {folder_name} path found for {self.os_type}")
-                    return None
-                
+            with open(cache_path, 'rb') as f:
+                cached_mtime, config = pickle.load(f)
+            if cached_mtime == mtime:
+                return config
+        except Exception:
+            pass
+
+        if orjson is not None:
+            config = orjson.loads(config_path.read_bytes())
+        else:
+            with open(config_path, 'r') as f:
+                config = json.load(f)
+
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump((mtime, config), f)
         except Exception as e:
-            logging.error(f"Error getting {folder_name} path: {e}")
-            logging.error(traceback.format_exc())
-            return None
+            logger.warning(f"Failed to cache configuration: {e}")
+        return config
 
-    def get_file_size(self, file_path: str) -> int:
-        """Get file size in bytes"""
+    def get_special_folder_path(self, folder_name: str) -> Optional[Path]:
+        """Get the path of special folders, resolving each one only once per process"""
+        cache_key = (self.os_type, folder_name)
+        with _SPECIAL_FOLDER_LOCK:
+            if cache_key in _SPECIAL_FOLDER_CACHE:
+                return _SPECIAL_FOLDER_CACHE[cache_key]
+            try:
+                path = self._get_folder(folder_name)
+            except Exception as e:
+                logger.exception(f"Error getting {folder_name} path: {e}")
+                return None
+            _SPECIAL_FOLDER_CACHE[cache_key] = path
+            return path
+
+    def _scan_names(self, path: Path) -> dict:
+        """Map lowercase names to directory entries for a single folder"""
         try:
-            return os.path.getsize(file_path)
-        except Exception:
-            return 0
+            with os.scandir(path) as it:
+                return {entry.name.lower(): entry for entry in it}
+        except Exception as e:
+            logger.warning(f"Failed to list {path}: {e}")
+            return {}
+
+    def _get_folder_windows(self, folder_name: str) -> Optional[Path]:
+        """Find a special folder on Windows, checking OneDrive and the shell"""
+        possible_paths = []
+        
+        # Add OneDrive path if it exists
+        if "onedrive" in self._home_entries:
+            if self._onedrive_entries is None:
+                self._onedrive_entries = self._scan_names(
+                    self._home_entries["onedrive"].path)
+            entry = self._onedrive_entries.get(folder_name.lower())
+            if entry is not None:
+                onedrive_path = Path(entry.path)
+                possible_paths.append(onedrive_path)
+                logger.info(f"Found OneDrive {folder_name} path: {onedrive_path}")
+        
+        # Add regular Windows path
+        entry = self._home_entries.get(folder_name.lower())
+        if entry is not None:
+            regular_path = Path(entry.path)
+            possible_paths.append(regular_path)
+            logger.info(f"Found regular {folder_name} path: {regular_path}")
+        
+        # For Downloads, also ask the shell for the known folder
+        if folder_name == "Downloads":
+            try:
+                known_path = Path(_get_known_folder_path(FOLDERID_DOWNLOADS))
+                if known_path.exists():
+                    possible_paths.append(known_path)
+                    logger.info(f"Found known folder {folder_name} path: {known_path}")
+            except Exception as e:
+                logger.warning(f"Failed to get Downloads known folder path: {e}")
+        
+        # If we found any valid paths, use the first one
+        if possible_paths:
+            chosen_path = possible_paths[0]
+            logger.info(f"Using {folder_name} path: {chosen_path}")
+            return chosen_path
+        else:
+            logger.error(f"No valid {folder_name} path found")
+            return None
+
+    def _get_folder_posix(self, folder_name: str) -> Optional[Path]:
+        """Find a special folder in the home directory on macOS and Linux"""
+        path = self._home / folder_name
+        if path.exists():
+            logger.info(f"Using {self.os_type} {folder_name} path: {path}")
+            return path
+        else:
+            logger.error(f"No valid {folder_name} path found for {self.os_type}")
+            return None
 
     def is_system_file(self, file_path: str) -> bool:
         """Enhanced system file checker"""
         try:
-            file_name = os.path.basename(file_path)
-            file_lower = file_name.lower()
-            
-            # Expanded system files list
-            system_files = [
-                "desktop.ini",
-                "recycle bin",
-                "trash",
-                "$recycle.bin",
-                ".ds_store",  # macOS system file
-                "thumbs.db"    # Windows thumbnail cache
-            ]
+            file_lower = os.path.basename(file_path).lower()
             
             # Check if it's a system file
-            if file_lower in system_files:
+            if _is_system_name(file_lower):
                 return True
             
             # Check if it's the Recycle Bin folder
-            if os.path.isdir(file_path) and ("$recycle.bin" in file_lower or "recycle bin" in file_lower):
-                return True
-            
+            return (any(m in file_lower for m in _RECYCLE_MARKERS) and
+                    os.path.isdir(file_path))
+        except Exception as e:
+            logger.warning(f"Error checking system file {file_path}: {e}")
             return False
+
+    def is_system_entry(self, entry: os.DirEntry, name_lower: Optional[str] = None) -> bool:
+        """System file checker for directory entries from os.scandir"""
+        try:
+            if name_lower is None:
+                name_lower = entry.name.lower()
+            
+            # System file, or the Recycle Bin folder (type is cached by scandir)
+            return _is_system_name(name_lower) or (
+                entry.is_dir(follow_symlinks=False) and
+                any(m in name_lower for m in _RECYCLE_MARKERS))
         except Exception as e:
-            logging.warning(f"Error checking system file {file_path}: {e}")
+            logger.warning(f"Error checking system file {entry.path}: {e}")
             return False
 
+    def should_move(self, entry: os.DirEntry) -> bool:
+        """Check whether a directory entry belongs in the archive"""
+        low = entry.name.lower()
+        
+        # Skip if:
+        # 1. It's the Archive folder itself or any Archive_<timestamp> folder
+        # 2. It's a system file or Recycle Bin
+        return (not low.startswith("archive") and
+                not self.is_system_entry(entry, low))
+
     def update_archive_timestamp(self, archive_path: str) -> str:
         """Update existing archive folder name with current timestamp"""
+        new_timestamp = time.strftime("%b-%d-%Y_%I-%M%p")
         try:
             if os.path.exists(archive_path):
-                current_time = datetime.datetime.now()
-                new_timestamp = current_time.strftime("%b-%d-%Y_%I-%M%p")
                 parent_dir = os.path.dirname(archive_path)
                 new_path = os.path.join(parent_dir, f"Archive_{new_timestamp}")
                 
                 # Rename the existing archive folder
                 try:
                     os.rename(archive_path, new_path)
-                    logging.info(f"Updated archive timestamp: {os.path.basename(new_path)}")
+                    logger.info(f"Updated archive timestamp: {os.path.basename(new_path)}")
                     return new_path
                 except Exception as e:
-                    logging.error(f"Failed to rename archive folder: {e}")
+                    logger.error(f"Failed to rename archive folder: {e}")
                     return archive_path
         except Exception as e:
-            logging.error(f"Error updating archive timestamp: {e}")
+            logger.error(f"Error updating archive timestamp: {e}")
             return archive_path
 
-    def organize_folder(self, folder_path: str) -> None:
+    def organize_folder(self, folder_path: Path) -> None:
         """Organize files with enhanced archive handling"""
         try:
-            if not folder_path or not os.path.exists(folder_path):
-                logging.error(f"Invalid or non-existent folder path: {folder_path}")
+            if not folder_path or not os.path.isdir(folder_path):
+                logger.error(f"Invalid or non-existent folder path: {folder_path}")
                 return
+            folder_path = Path(folder_path)
 
-            # Create or get the root archive folder (always named "Archive")
-            archive_folder = os.path.join(folder_path, "Archive")
-            if not os.path.exists(archive_folder):
-                os.makedirs(archive_folder)
-                logging.info(f"Created archive folder: {archive_folder}")
-
-            # Create new dated subfolder
-            current_time = datetime.datetime.now()
-            timestamp = current_time.strftime("%b-%d-%Y_%I-%M%p")
-            dated_subfolder = os.path.join(archive_folder, timestamp)
-            
-            # Get all items in the directory
+            # Lazily scan the directory (scandir caches name, path and stat)
             try:
-                all_items = os.listdir(folder_path)
+                scan = os.scandir(folder_path)
             except Exception as e:
-                logging.error(f"Failed to list directory contents for {folder_path}: {e}")
+                logger.error(f"Failed to list directory contents for {folder_path}: {e}")
                 return
 
-            # Filter items to move
-            files_to_move = []
-            for item in all_items:
-                item_path = os.path.join(folder_path, item)
-                
-                # Skip if:
-                # 1. It's the Archive folder itself
-                # 2. It's a system file or Recycle Bin
-                # 3. It's any kind of archive folder
-                if (item != "Archive" and 
-                    not self.is_system_file(item_path) and
-                    not "archive" in item.lower()):
-                    files_to_move.append(item)
-
-            if files_to_move:
-                # Create the dated subfolder
-                os.makedirs(dated_subfolder, exist_ok=True)
-                logging.info(f"Created dated subfolder: {timestamp}")
-                
-                for item in files_to_move:
-                    try:
-                        item_path = os.path.join(folder_path, item)
-                        target_path = os.path.join(dated_subfolder, item)
-                        
-                        # Handle file in use errors
-                        retry_count = 3
-                        while retry_count > 0:
-                            try:
-                                # Update statistics before moving
-                                self.stats["space_cleared"] += self.get_file_size(item_path)
-                                shutil.move(item_path, target_path)
-                                self.stats["files_moved"] += 1
-                                logging.info(f"Moved: {item}")
-                                break
-                            except PermissionError:
-                                retry_count -= 1
-                                time.sleep(1)
-                                if retry_count == 0:
-                                    raise
-                        
-                    except Exception as e:
-                        self.stats["errors"] += 1
-                        logging.error(f"Error moving {item}: {e}")
+            with scan:
+                candidates = (entry for entry in scan if self.should_move(entry))
+                first = next(candidates, None)
+                if first is None:
+                    logger.info(f"No files to organize in {folder_path}")
+                    return
+                files_to_move = list(itertools.chain([first], candidates))
+
+            # Create or get the root archive folder (always named "Archive")
+            archive_folder = folder_path / "Archive"
+            try:
+                archive_folder.mkdir()
+                logger.info(f"Created archive folder: {archive_folder}")
+            except FileExistsError:
+                pass
+
+            # Create the dated subfolder
+            timestamp = time.strftime("%b-%d-%Y_%I-%M%p")
+            dated_subfolder = archive_folder / timestamp
+            dated_subfolder.mkdir(exist_ok=True)
+            logger.info(f"Created dated subfolder: {timestamp}")
             
-            else:
-                logging.info(f"No files to organize in {folder_path}")
+            # Renames are independent syscalls, so run them concurrently. Entries
+            # are sorted and bucketed by first letter, one thread per bucket, so
+            # related names land in the destination index together.
+            files_to_move.sort(key=lambda entry: entry.name.lower())
+            buckets = [list(group) for _, group in itertools.groupby(
+                files_to_move, key=lambda entry: entry.name[:1].lower())]
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
+                futures = [ex.submit(self._move_bucket, bucket, dated_subfolder)
+                           for bucket in buckets]
+                for future in futures:
+                    future.result()
 
         except Exception as e:
-            logging.error(f"Organization failed for {folder_path}: {e}")
-            logging.error(traceback.format_exc())
+            logger.exception(f"Organization failed for {folder_path}: {e}")
+
+    def _move_bucket(self, entries: list, dated_subfolder: Path) -> None:
+        """Move a group of entries into the dated subfolder one after another"""
+        for entry in entries:
+            item = entry.name
+            try:
+                size = self._move_entry(entry, dated_subfolder / item)
+                with self._stats_lock:
+                    self.stats["space_cleared"] += size
+                    self.stats["files_moved"] += 1
+                logger.debug("Moved: %s", item)
+            except Exception as e:
+                with self._stats_lock:
+                    self.stats["errors"] += 1
+                logger.exception(f"Error moving {item}: {e}")
+
+    def _move_entry(self, entry: os.DirEntry, target_path: Path) -> int:
+        """Move one entry into the archive, returning the bytes moved"""
+        item_path = entry.path
+        
+        # Size from the scandir stat cache; folders are summed once
+        if entry.is_dir(follow_symlinks=False):
+            size = _dir_size(item_path)
+        else:
+            size = entry.stat(follow_symlinks=False).st_size
+        
+        # Handle file in use errors, backing off between attempts
+        for delay in _RETRY_DELAYS:
+            try:
+                _move_path(item_path, target_path)
+                return size
+            except PermissionError as e:
+                logger.warning(f"{entry.name} is in use, retrying: {e}")
+                time.sleep(delay)
+
+        # Final attempt; failure propagates with its traceback to the caller
+        _move_path(item_path, target_path)
+        return size
 
     def organize(self):
         """Main organization method"""
         try:
-            logging.info("Starting organization process...")
+            logger.info("Starting organization process...")
 
             if self.desktop_path:
-                logging.info("Organizing Desktop...")
+                logger.info("Organizing Desktop...")
                 self.organize_folder(self.desktop_path)
             else:
-                logging.error("Skipping Desktop organization - path not available")
+                logger.error("Skipping Desktop organization - path not available")
 
             if self.downloads_path:
-                logging.info("Organizing Downloads...")
+                logger.info("Organizing Downloads...")
                 self.organize_folder(self.downloads_path)
             else:
-                logging.error("Skipping Downloads organization - path not available")
+                logger.error("Skipping Downloads organization - path not available")
 
             self.print_statistics()
 
         except Exception as e:
-            logging.error(f"Organization failed: {e}")
-            logging.error(traceback.format_exc())
+            logger.exception(f"Organization failed: {e}")
             self.stats["errors"] += 1
         finally:
-            logging.info("Organization complete!")
+            logger.info("Organization complete!")
 
     def print_statistics(self):
         """Print organization statistics"""
-        logging.info("\n=== Organization Statistics ===")
-        logging.info(f"Files moved: {self.stats['files_moved']}")
-        logging.info(f"Space cleared: {self.stats['space_cleared'] / (1024*1024):.2f} MB")
-        logging.info(f"Errors encountered: {self.stats['errors']}")
-        logging.info("===========================")
+        logger.info("\n=== Organization Statistics ===")
+        logger.info(f"Files moved: {self.stats['files_moved']}")
+        logger.info(f"Space cleared: {self.stats['space_cleared'] / (1024*1024):.2f} MB")
+        logger.info(f"Errors encountered: {self.stats['errors']}")
+        logger.info("===========================")
 
 def main():
     try:
@@ -302,8 +473,7 @@ def main():
     
     except Exception as e:
         print(f"\nError occurred: {str(e)}")
-        logging.error(f"Error occurred: {str(e)}")
-        logging.error(traceback.format_exc())
+        logger.exception(f"Error occurred: {str(e)}")
         input("Press Enter to exit...")
 
 if __name__ == "__main__":
@@ -1,19 +1,32 @@
 # Standard library imports
 import os
 import logging
+import logging.handlers
+import queue
+import atexit
 import json
+import hashlib
 import platform
 import shutil
 import time
 import traceback
 import datetime
+import errno
 import ctypes
+from ctypes import wintypes
 import sys
 import threading
-import winreg
+import types
+import concurrent.futures
 from pathlib import Path
 from typing import Optional
 
+# Optional faster JSON parser
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # GUI imports
 import tkinter as tk
 from tkinter import ttk, messagebox
@@ -22,19 +35,206 @@ from tkinter import ttk, messagebox
 from PIL import Image, ImageDraw
 import pystray
 
+# Windows-only modules: winreg for folder lookups and the startup entry,
+# optional pywin32 to hide the console window
+winreg = win32gui = win32con = None
+if sys.platform == 'win32':
+    import winreg
+    try:
+        import win32gui
+        import win32con
+    except ImportError:
+        pass
+
+# Archive folders (often on OneDrive) are I/O bound, so use plenty of threads
+ARCHIVE_WORKERS = 32
+
+# Dated folders scanned and styled concurrently by fix_onedrive_archives
+DIR_SCAN_WORKERS = 4
+
+# Shared pool that overlaps the blocking renames of misplaced archive files
+_MOVE_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+
+# Desktop.ini icon resource and background color for each category folder
+CATEGORY_STYLES = {
+    "Audio": ("%SystemRoot%\\system32\\SHELL32.dll,137", "144 238 144"),  # Light green
+    "Documents": ("%SystemRoot%\\system32\\SHELL32.dll,21", "255 232 186"),  # Light yellow
+    "Images": ("%SystemRoot%\\system32\\SHELL32.dll,140", "173 216 230"),  # Light blue
+    "Video": ("%SystemRoot%\\system32\\SHELL32.dll,136", "255 182 193"),  # Light pink
+    "Shortcuts": ("%SystemRoot%\\system32\\SHELL32.dll,29", "255 215 0"),  # Gold
+    "Code": ("%SystemRoot%\\system32\\SHELL32.dll,70", "221 160 221"),  # Purple
+    "Executables": ("%SystemRoot%\\system32\\SHELL32.dll,8", "255 160 122"),  # Coral
+    "ZIP_Files": ("%SystemRoot%\\system32\\zipfldr.dll,0", "210 180 140"),  # Tan
+    "RAR_Files": ("%SystemRoot%\\system32\\SHELL32.dll,165", "210 180 140"),  # Tan
+    "Other_Archives": ("%SystemRoot%\\system32\\SHELL32.dll,165", "210 180 140"),  # Tan
+    "Others": ("%SystemRoot%\\system32\\SHELL32.dll,234", "211 211 211"),  # Light gray
+}
+
+# Extensions that are always filed under Shortcuts
+_SHORTCUT_EXTS = frozenset({'.lnk', '.url', '.desktop'})
+
+def _is_shortcut(name: str) -> bool:
+    """Whether a file name has a shortcut extension (only the extension is lowercased)"""
+    dot = name.rfind('.')
+    return dot != -1 and name[dot:].lower() in _SHORTCUT_EXTS
+
+def _lower_ext(name: str) -> str:
+    """Lowercased extension of a file name, like splitext but without copying the whole name"""
+    dot = name.rfind('.')
+    return name[dot:].lower() if dot > 0 else ''
+
+# Names that are never organized
+_SYSTEM_FILES = frozenset({
+    "desktop.ini",
+    "recycle bin",
+    "trash",
+    "$recycle.bin",
+    ".ds_store",  # macOS system file
+    "thumbs.db"    # Windows thumbnail cache
+})
+
+# Complete Desktop.ini contents per category, encoded once at import
+_DESKTOP_INI_BY_CATEGORY = {
+    category: (
+        "[.ShellClassInfo]\r\n"
+        f"IconResource={icon}\r\n"
+        f"BackgroundColor={color}\r\n"
+    ).encode('utf-8')
+    for category, (icon, color) in CATEGORY_STYLES.items()
+}
+_DEFAULT_DESKTOP_INI = _DESKTOP_INI_BY_CATEGORY["Others"]
+
+INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+
+if sys.platform == 'win32':
+    # Bind the Win32 attribute functions once instead of resolving them per call
+    _SetFileAttributesW = ctypes.windll.kernel32.SetFileAttributesW
+    _SetFileAttributesW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD]
+    _SetFileAttributesW.restype = wintypes.BOOL
+    _GetFileAttributesW = ctypes.windll.kernel32.GetFileAttributesW
+    _GetFileAttributesW.argtypes = [wintypes.LPCWSTR]
+    _GetFileAttributesW.restype = wintypes.DWORD
+
+    def _ensure_attr(path: str, wanted: int) -> None:
+        """Set file attributes only when some of the wanted bits are missing"""
+        attrs = _GetFileAttributesW(path)
+        if attrs != INVALID_FILE_ATTRIBUTES and attrs & wanted == wanted:
+            return
+        _SetFileAttributesW(path, wanted)
+else:
+    # Hidden/System/Read-only folder attributes only exist on Windows
+    def _SetFileAttributesW(path: str, attrs: int) -> bool:
+        return True
+
+    def _ensure_attr(path: str, wanted: int) -> None:
+        pass
+
+_LONG_PATH_PREFIX = '\\\\?\\'
+
+def _long_path(path: str) -> str:
+    """Extended-length form of path on Windows so deep archives bypass MAX_PATH handling"""
+    if os.name != 'nt' or path.startswith(_LONG_PATH_PREFIX):
+        return path
+    path = os.path.abspath(path)
+    if path.startswith('\\\\'):
+        return _LONG_PATH_PREFIX + 'UNC' + path[1:]
+    return _LONG_PATH_PREFIX + path
+
+def _display_path(path: str) -> str:
+    """Path without the extended-length prefix, for log messages"""
+    if path.startswith(_LONG_PATH_PREFIX + 'UNC\\'):
+        return '\\' + path[len(_LONG_PATH_PREFIX) + 3:]
+    if path.startswith(_LONG_PATH_PREFIX):
+        return path[len(_LONG_PATH_PREFIX):]
+    return path
+
+def _move_path(src: str, dst: str) -> None:
+    """Rename src to dst, copying only when they are on different devices"""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno == errno.EXDEV:
+            shutil.move(src, dst)
+        else:
+            raise
+
+def _move_new(src: str, dst: str) -> bool:
+    """Move src to dst unless dst already exists; returns whether it moved"""
+    if os.name == 'nt':
+        # Windows rename refuses an existing target, so it doubles as the existence check
+        try:
+            os.rename(src, dst)
+            return True
+        except FileExistsError:
+            return False
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+        shutil.move(src, dst)
+        return True
+
+    # POSIX rename silently replaces the target, so check first
+    if os.path.lexists(dst):
+        return False
+    _move_path(src, dst)
+    return True
+
+def _write_desktop_ini(ini_path: str, category: str) -> None:
+    """Write a category's Desktop.ini with a single low-level write"""
+    data = _DESKTOP_INI_BY_CATEGORY.get(category, _DEFAULT_DESKTOP_INI)
+    fd = os.open(ini_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0))
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+def _desktop_ini_is_current(ini_path: str, category: str) -> bool:
+    """Whether a category's Desktop.ini is already on disk (content is fixed per category)"""
+    try:
+        size = os.stat(ini_path).st_size
+    except OSError:
+        return False
+    return size == len(_DESKTOP_INI_BY_CATEGORY.get(category, _DEFAULT_DESKTOP_INI))
+
+_log_listener = None
+_log_lock = threading.Lock()
+
+def _setup_logging() -> logging.handlers.QueueListener:
+    """Route logging through a queue so file and console writes happen on a background thread"""
+    global _log_listener
+    with _log_lock:
+        if _log_listener is None:
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            file_handler = logging.FileHandler('file_organizer.log')
+            console_handler = logging.StreamHandler()  # Also print to console
+            file_handler.setFormatter(formatter)
+            console_handler.setFormatter(formatter)
+
+            log_queue = queue.Queue(-1)
+            _log_listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+            _log_listener.start()
+            atexit.register(_log_listener.stop)
+
+            # LOGLEVEL=DEBUG brings back the per-file move messages
+            root = logging.getLogger()
+            level = logging.getLevelName(os.environ.get('LOGLEVEL', 'INFO').upper())
+            root.setLevel(level if isinstance(level, int) else logging.INFO)
+            root.addHandler(logging.handlers.QueueHandler(log_queue))
+    return _log_listener
+
+def _manifest_path() -> str:
+    """Per-user location of the archive manifest (next to the script when LOCALAPPDATA is unset)"""
+    base = os.environ.get('LOCALAPPDATA')
+    if base:
+        return os.path.join(base, 'FileOrganizer', 'archive_manifest.json')
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'archive_manifest.json')
+
 class FileOrganizer:
     def __init__(self, config_path: str = "config.json"):
         """Initialize the File Organizer with enhanced error handling"""
         try:
             # Set up logging first
-            logging.basicConfig(
-                level=logging.INFO,
-                format='%(asctime)s - %(levelname)s - %(message)s',
-                handlers=[
-                    logging.FileHandler('file_organizer.log'),
-                    logging.StreamHandler()  # Also print to console
-                ]
-            )
+            self._log_listener = _setup_logging()
             logging.info("Initializing File Organizer...")
 
             # Detect OS
@@ -43,13 +243,29 @@ class FileOrganizer:
 
             # Load configuration
             try:
-                with open(config_path, 'r') as f:
-                    self.config = json.load(f)
+                if orjson is not None:
+                    with open(config_path, 'rb') as f:
+                        self.config = orjson.loads(f.read())
+                else:
+                    with open(config_path, 'r') as f:
+                        self.config = json.load(f)
+                self.categories = types.MappingProxyType(self.config['categories'])
+                if not all(isinstance(info.get('extensions'), list) for info in self.categories.values()):
+                    raise ValueError("every category needs an 'extensions' list")
                 logging.info("Configuration loaded successfully")
             except Exception as e:
                 logging.error(f"Failed to load configuration: {e}")
                 raise
 
+            # Category names and an inverted extension -> category index for the hot loops
+            self._category_names = tuple(self.categories)
+            self._ext_to_cat = {
+                sys.intern(ext.lower()): category
+                for category, info in self.categories.items()
+                for ext in info['extensions']
+            }
+            self._ext_to_cat.update(dict.fromkeys(_SHORTCUT_EXTS, 'Shortcuts'))
+
             # Initialize statistics
             self.stats = {
                 "files_moved": 0,
@@ -57,6 +273,33 @@ class FileOrganizer:
                 "errors": 0
             }
 
+            # Home directory and the OneDrive archive folders beneath it
+            self.home_path = os.path.expanduser('~')
+            self._onedrive_roots = tuple(
+                os.path.join(self.home_path, base, 'Archive - Pre-2024', leaf, 'Archive')
+                for base in ('OneDrive', 'OneDrive - Business')
+                for leaf in ('Desktop', 'Downloads')
+            )
+
+            # Special folder lookups and archive roots are resolved once per organizer
+            self._special_folders = {}
+            self._user_shell_folders = None
+            self._shell_folders_lock = threading.Lock()
+            self._archive_roots = None
+            self._styled_folders = set()
+            self._ensured_dirs = set()
+
+            # Dated folders already found complete, keyed on path -> folder mtime; the
+            # key ties it to the category setup so config changes invalidate it
+            self._manifest_key = hashlib.sha1(json.dumps(
+                [dict(self.categories), CATEGORY_STYLES], sort_keys=True).encode('utf-8')).hexdigest()
+            self._manifest_path = _manifest_path()
+            self._manifest = self._load_manifest()
+            self._seen_dated_folders = set()
+
+            # One archive timestamp for the whole run so every step lands in the same folder
+            self._session_ts = datetime.datetime.now().strftime("%b-%d-%Y_%I-%M%p")
+
             # Verify and get special folders with more detailed logging
             self.desktop_path = self.get_special_folder_path("Desktop")
             self.downloads_path = self.get_special_folder_path("Downloads")
@@ -79,10 +322,18 @@ class FileOrganizer:
             raise
 
     def get_special_folder_path(self, folder_name: str) -> Optional[str]:
-        """Get the path of special folders with multi-OS support"""
-        try:
-            if self.os_type == "Windows":
-                # Define known folder GUIDs
+        """Get the path of special folders, resolving each folder only once"""
+        path = self._special_folders.get(folder_name)
+        if path is None and folder_name not in self._special_folders:
+            # Concurrent callers resolve the same answer; the first one stored wins
+            path = self._special_folders.setdefault(folder_name, self._lookup_special_folder_path(folder_name))
+        return path
+
+    def _get_user_shell_folders(self) -> dict:
+        """Read all known folders from the User Shell Folders key in one pass"""
+        with self._shell_folders_lock:
+            if self._user_shell_folders is None:
+                # Known folder GUIDs (used as value names for some folders, e.g. Downloads)
                 known_folders = {
                     'Desktop': '{B4BFCC3A-DB2C-424C-B029-7FE99A87C641}',
                     'Documents': '{FDD39AD0-238F-46AF-ADB4-6C85480369C7}',
@@ -91,39 +342,50 @@ class FileOrganizer:
                     'Pictures': '{33E28130-4E1E-4676-835A-98395C3BC3BB}',
                     'Videos': '{18989B1D-99B5-455B-841C-AB7C74E4DDFC}'
                 }
+                folders = {}
+                try:
+                    sub_key = "SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Explorer\\User Shell Folders"
+                    with winreg.OpenKey(winreg.HKEY_CURRENT_USER, sub_key) as key:
+                        for name, guid in known_folders.items():
+                            for value_name in (name, guid):
+                                try:
+                                    folders[name] = os.path.expandvars(winreg.QueryValueEx(key, value_name)[0])
+                                    break
+                                except OSError:
+                                    continue
+                except Exception:
+                    pass
+                self._user_shell_folders = folders
+        return self._user_shell_folders
 
-                if folder_name in known_folders:
-                    try:
-                        import winreg
-                        sub_key = f"SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Explorer\\User Shell Folders"
-                        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, sub_key) as key:
-                            path = winreg.QueryValueEx(key, folder_name)[0]
-                            path = os.path.expandvars(path)
-                            if os.path.exists(path):
-                                return path
-                    except Exception:
-                        pass
-
-                    # Try alternative method using shell32
-                    try:
-                        import ctypes
-                        from ctypes import wintypes, windll
-                        CSIDL_VALUES = {
-                            'Desktop': 0,
-                            'Documents': 5,
-                            'Music': 13,
-                            'Pictures': 39,
-                            'Videos': 14,
-                            'Downloads': 0x1A
-                        }
-                        if folder_name in CSIDL_VALUES:
-                            buf = ctypes.create_unicode_buffer(wintypes.MAX_PATH)
-                            windll.shell32.SHGetFolderPathW(None, CSIDL_VALUES[folder_name], None, 0, buf)
-                            path = buf.value
-                            if os.path.exists(path):
-                                return path
-                    except Exception:
-                        pass
+    def _lookup_special_folder_path(self, folder_name: str) -> Optional[str]:
+        """Get the path of special folders with multi-OS support"""
+        try:
+            if self.os_type == "Windows":
+                path = self._get_user_shell_folders().get(folder_name)
+                if path and os.path.exists(path):
+                    return path
+
+                # Try alternative method using shell32
+                try:
+                    import ctypes
+                    from ctypes import wintypes, windll
+                    CSIDL_VALUES = {
+                        'Desktop': 0,
+                        'Documents': 5,
+                        'Music': 13,
+                        'Pictures': 39,
+                        'Videos': 14,
+                        'Downloads': 0x1A
+                    }
+                    if folder_name in CSIDL_VALUES:
+                        buf = ctypes.create_unicode_buffer(wintypes.MAX_PATH)
+                        windll.shell32.SHGetFolderPathW(None, CSIDL_VALUES[folder_name], None, 0, buf)
+                        path = buf.value
+                        if os.path.exists(path):
+                            return path
+                except Exception:
+                    pass
 
                 # Fallback to environment variables
                 env_vars = {
@@ -151,17 +413,17 @@ class FileOrganizer:
                     'Movies': 'Movies'  # macOS uses Movies instead of Videos
                 }
                 if folder_name in mac_paths:
-                    path = os.path.join(os.path.expanduser('~'), mac_paths[folder_name])
+                    path = os.path.join(self.home_path, mac_paths[folder_name])
                     if os.path.exists(path):
                         return path
 
             elif self.os_type == "Linux":
                 # Use XDG user dirs
                 try:
-                    with open(os.path.expanduser('~/.config/user-dirs.dirs'), 'r') as f:
+                    with open(os.path.join(self.home_path, '.config', 'user-dirs.dirs'), 'r') as f:
                         for line in f:
                             if line.startswith(f'XDG_{folder_name.upper()}_DIR'):
-                                path = line.split('=')[1].strip('"').replace('$HOME', os.path.expanduser('~'))
+                                path = line.split('=')[1].strip('"').replace('$HOME', self.home_path)
                                 if os.path.exists(path):
                                     return path
                 except Exception:
@@ -177,7 +439,7 @@ class FileOrganizer:
                     'Videos': 'Videos'
                 }
                 if folder_name in linux_paths:
-                    path = os.path.join(os.path.expanduser('~'), linux_paths[folder_name])
+                    path = os.path.join(self.home_path, linux_paths[folder_name])
                     if os.path.exists(path):
                         return path
 
@@ -188,36 +450,29 @@ class FileOrganizer:
             logging.error(traceback.format_exc())
             return None
 
-    def get_file_size(self, file_path: str) -> int:
-        """Get file size in bytes"""
+    def get_file_size(self, file_path) -> int:
+        """Get file size in bytes (uses the cached stat for scandir entries)"""
         try:
+            if isinstance(file_path, os.DirEntry):
+                return file_path.stat().st_size
             return os.path.getsize(file_path)
         except Exception:
             return 0
 
-    def is_system_file(self, file_path: str) -> bool:
-        """Enhanced system file checker"""
+    def is_system_file(self, file_path: str, entry: Optional[os.DirEntry] = None) -> bool:
+        """Enhanced system file checker (pass the scandir entry to reuse its cached type)"""
         try:
-            file_name = os.path.basename(file_path)
-            file_lower = file_name.lower()
-            
-            # Expanded system files list
-            system_files = [
-                "desktop.ini",
-                "recycle bin",
-                "trash",
-                "$recycle.bin",
-                ".ds_store",  # macOS system file
-                "thumbs.db"    # Windows thumbnail cache
-            ]
+            file_lower = os.path.basename(file_path).lower()
             
             # Check if it's a system file
-            if file_lower in system_files:
+            if file_lower in _SYSTEM_FILES:
                 return True
             
-            # Check if it's the Recycle Bin folder
-            if os.path.isdir(file_path) and ("$recycle.bin" in file_lower or "recycle bin" in file_lower):
-                return True
+            # Only names that look like the Recycle Bin need the directory check
+            if "$recycle.bin" in file_lower or "recycle bin" in file_lower:
+                if entry is not None:
+                    return entry.is_dir(follow_symlinks=False)
+                return os.path.isdir(file_path)
             
             return False
         except Exception as e:
@@ -228,8 +483,7 @@ class FileOrganizer:
         """Update existing archive folder name with current timestamp"""
         try:
             if os.path.exists(archive_path):
-                current_time = datetime.datetime.now()
-                new_timestamp = current_time.strftime("%b-%d-%Y_%I-%M%p")
+                new_timestamp = self._session_ts
                 parent_dir = os.path.dirname(archive_path)
                 new_path = os.path.join(parent_dir, f"Archive_{new_timestamp}")
                 
@@ -245,6 +499,20 @@ class FileOrganizer:
             logging.error(f"Error updating archive timestamp: {e}")
             return archive_path
 
+    def _ensure_dir(self, path: str) -> bool:
+        """Create a directory once per run; returns True only when this call created it"""
+        if path in self._ensured_dirs:
+            return False
+        try:
+            os.makedirs(path)
+            created = True
+        except FileExistsError:
+            if not os.path.isdir(path):
+                raise
+            created = False
+        self._ensured_dirs.add(path)
+        return created
+
     def set_folder_color(self, folder_path: str, category: str) -> None:
         """Set folder color and icon using Desktop.ini"""
         try:
@@ -252,20 +520,11 @@ class FileOrganizer:
                 return
 
             ini_path = os.path.join(folder_path, "Desktop.ini")
-            with open(ini_path, 'w') as f:
-                f.write("[.ShellClassInfo]\n")
-                
-                # Category-specific icons
-                if category == "Shortcuts":
-                    f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,29\n")  # Star/favorite icon
-                    f.write("IconFile=%SystemRoot%\\system32\\SHELL32.dll\n")
-                    f.write("IconIndex=29\n")
-                    f.write("BackgroundColor=255 215 0\n")  # Gold
-                # ... (rest of your categories)
+            _write_desktop_ini(ini_path, category)
 
             # Set system and hidden attributes
-            ctypes.windll.kernel32.SetFileAttributesW(ini_path, 0x2 | 0x4)
-            ctypes.windll.kernel32.SetFileAttributesW(folder_path, 0x1)
+            _ensure_attr(ini_path, 0x2 | 0x4)
+            _ensure_attr(folder_path, 0x1)
 
         except Exception as e:
             logging.warning(f"Failed to set folder icon and color: {e}")
@@ -300,73 +559,50 @@ class FileOrganizer:
     def update_all_archives(self) -> None:
         """Find and update all archive folders recursively"""
         try:
-            # Get all possible archive locations
-            archive_locations = []
-            
-            # Add OneDrive archives
-            archive_locations.extend(self.get_onedrive_archives())
-            
-            # Add local archives
-            if self.desktop_path:
-                archive_locations.append(os.path.join(self.desktop_path, "Archive"))
-            if self.downloads_path:
-                archive_locations.append(os.path.join(self.downloads_path, "Archive"))
-
-            for archive_path in archive_locations:
-                if os.path.exists(archive_path):
-                    logging.info(f"Processing archive: {archive_path}")
-                    
-                    # Process all dated folders
-                    for root, dirs, _ in os.walk(archive_path):
-                        for dir_name in dirs:
-                            if "_" in dir_name:  # Likely a dated folder
-                                dated_path = os.path.join(root, dir_name)
-                                logging.info(f"Updating dated folder: {dated_path}")
-                                
-                                # Create/update category folders
-                                for category in self.categories.keys():
-                                    category_path = os.path.join(dated_path, category)
-                                    os.makedirs(category_path, exist_ok=True)
-                                    self.set_folder_color(category_path, category)
-                                
-                                # Move misplaced files
-                                for item in os.listdir(dated_path):
-                                    item_path = os.path.join(dated_path, item)
-                                    if os.path.isfile(item_path):
-                                        self.move_to_category(item_path, dated_path)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=ARCHIVE_WORKERS) as pool:
+                futures = {pool.submit(self._update_dated_folder, dated_path, files): dated_path
+                           for dated_path, files in self._iter_dated_archive_folders()}
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logging.error(f"Failed to update {_display_path(futures[future])}: {e}")
 
         except Exception as e:
             logging.error(f"Failed to update archives: {e}")
             logging.error(traceback.format_exc())
 
+    def _update_dated_folder(self, dated_path: str, files: list) -> None:
+        """Create category folders in a dated folder and sort its loose files"""
+        logging.info(f"Updating dated folder: {_display_path(dated_path)}")
+        
+        # Create/update category folders
+        for category in self._category_names:
+            category_path = os.path.join(dated_path, category)
+            self._ensure_dir(category_path)
+            self.set_folder_color(category_path, category)
+        
+        # Move misplaced files
+        for entry in files:
+            self.move_to_category(entry.path, dated_path)
+
     def move_to_category(self, file_path: str, dated_folder: str) -> None:
         """Move a file to its correct category folder"""
         try:
             file_name = os.path.basename(file_path)
-            _, ext = os.path.splitext(file_name.lower())
+            ext = _lower_ext(file_name)
             
-            # Determine category
-            category = 'Others'
-            
-            # Check for shortcuts first
-            if ext in ['.lnk', '.url', '.desktop']:
-                category = 'Shortcuts'
-            else:
-                # Check other categories
-                for cat, info in self.categories.items():
-                    if ext in info['extensions']:
-                        category = cat
-                        break
+            # Determine category (shortcuts are always in the index)
+            category = self._ext_to_cat.get(ext, 'Others')
             
             target_dir = os.path.join(dated_folder, category)
             target_path = os.path.join(target_dir, file_name)
             
-            if not os.path.exists(target_path):
-                shutil.move(file_path, target_path)
-                logging.info(f"Moved {file_name} to {category}")
+            if _move_new(file_path, target_path):
+                logging.debug("Moved %s to %s", file_name, category)
             
         except Exception as e:
-            logging.error(f"Failed to move file {file_path}: {e}")
+            logging.error(f"Failed to move file {_display_path(file_path)}: {e}")
 
     def organize_folder(self, folder_path: str) -> None:
         """Organize files with enhanced archive handling and category sorting"""
@@ -375,24 +611,23 @@ class FileOrganizer:
                 logging.error(f"Invalid or non-existent folder path: {folder_path}")
                 return
 
-            # Get all items in the folder
-            items = os.listdir(folder_path)
-            
-            # Handle shortcuts first
-            shortcuts = [item for item in items if item.lower().endswith(('.lnk', '.url', '.desktop'))]
-            if shortcuts:
-                timestamp = datetime.datetime.now().strftime("%b-%d-%Y_%I-%M%p")
-                archive_path = os.path.join(folder_path, "Archive", timestamp)
-                shortcuts_path = os.path.join(archive_path, "Shortcuts")
-                os.makedirs(shortcuts_path, exist_ok=True)
-                self.set_folder_color(shortcuts_path, "Shortcuts")
-                
-                for shortcut in shortcuts:
+            # Handle shortcuts first, moving each one as the scan reaches it
+            shortcuts_path = None
+            with os.scandir(folder_path) as it:
+                for entry in it:
+                    shortcut = entry.name
+                    if not _is_shortcut(shortcut):
+                        continue
+                    if shortcuts_path is None:
+                        archive_path = os.path.join(folder_path, "Archive", self._session_ts)
+                        shortcuts_path = os.path.join(archive_path, "Shortcuts")
+                        self._ensure_dir(shortcuts_path)
+                        self.set_folder_color(shortcuts_path, "Shortcuts")
+
                     try:
-                        source_path = os.path.join(folder_path, shortcut)
                         target_path = os.path.join(shortcuts_path, shortcut)
-                        shutil.move(source_path, target_path)
-                        logging.info(f"Moved shortcut: {shortcut}")
+                        if _move_new(entry.path, target_path):
+                            logging.debug("Moved shortcut: %s", shortcut)
                     except Exception as e:
                         logging.error(f"Failed to move shortcut {shortcut}: {e}")
 
@@ -407,37 +642,30 @@ class FileOrganizer:
         """Aggressively handle shortcuts before anything else"""
         try:
             # Force create Shortcuts folder in current archive
-            timestamp = datetime.datetime.now().strftime("%b-%d-%Y_%I-%M%p")
+            timestamp = self._session_ts
             archive_path = os.path.join(folder_path, "Archive", timestamp)
             shortcuts_path = os.path.join(archive_path, "Shortcuts")
-            os.makedirs(shortcuts_path, exist_ok=True)
+            self._ensure_dir(shortcuts_path)
             
             # Set shortcuts folder icon and color
             ini_path = os.path.join(shortcuts_path, "Desktop.ini")
-            with open(ini_path, 'w', encoding='utf-8') as f:
-                f.write("[.ShellClassInfo]\n")
-                f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,29\n")
-                f.write("IconFile=%SystemRoot%\\system32\\SHELL32.dll\n")
-                f.write("IconIndex=29\n")
-                f.write("BackgroundColor=255 215 0\n")  # Gold
+            _write_desktop_ini(ini_path, "Shortcuts")
             
             # Set folder attributes
-            ctypes.windll.kernel32.SetFileAttributesW(ini_path, 0x2 | 0x4)  # Hidden | System
-            ctypes.windll.kernel32.SetFileAttributesW(shortcuts_path, 0x1)  # Read-only
+            _ensure_attr(ini_path, 0x2 | 0x4)  # Hidden | System
+            _ensure_attr(shortcuts_path, 0x1)  # Read-only
             
             # Find and move all shortcuts
-            for item in os.listdir(folder_path):
-                if item.lower().endswith(('.lnk', '.url', '.desktop')):
-                    try:
-                        source = os.path.join(folder_path, item)
-                        target = os.path.join(shortcuts_path, item)
-                        if os.path.exists(source):
-                            shutil.move(source, target)
-                            print(f"Moved shortcut: {item}")  # Direct console output
-                            logging.info(f"Moved shortcut: {item}")
-                    except Exception as e:
-                        print(f"Failed to move shortcut {item}: {e}")  # Direct console output
-                        logging.error(f"Failed to move shortcut {item}: {e}")
+            with os.scandir(folder_path) as it:
+                for entry in it:
+                    item = entry.name
+                    if _is_shortcut(item):
+                        try:
+                            target = os.path.join(shortcuts_path, item)
+                            if _move_new(entry.path, target):
+                                logging.debug("Moved shortcut: %s", item)
+                        except Exception as e:
+                            logging.error(f"Failed to move shortcut {item}: {e}")
             
         except Exception as e:
             print(f"Error in handle_shortcuts_first: {e}")  # Direct console output
@@ -447,46 +675,15 @@ class FileOrganizer:
     def force_update_onedrive_archive(self) -> None:
         """Force update OneDrive archives"""
         try:
-            # Try both possible OneDrive paths
-            onedrive_paths = [
-                os.path.join(os.path.expanduser('~'), 'OneDrive', 'Archive - Pre-2024'),
-                os.path.join(os.path.expanduser('~'), 'OneDrive - Business', 'Archive - Pre-2024')
-            ]
-            
-            for onedrive_path in onedrive_paths:
-                if os.path.exists(onedrive_path):
-                    print(f"Updating OneDrive archive: {onedrive_path}")  # Direct console output
-                    
-                    # Process each dated folder
-                    for item in os.listdir(onedrive_path):
-                        dated_path = os.path.join(onedrive_path, item)
-                        if os.path.isdir(dated_path) and "_" in item:
-                            print(f"Processing: {item}")  # Direct console output
+            for dated_path, _ in self._iter_dated_archive_folders(self._home_onedrive_archives()):
+                print(f"Processing: {os.path.basename(dated_path)}")  # Direct console output
+                
+                # Update/create each category folder with its icon and color
+                for category in self._category_names:
+                    category_path = os.path.join(dated_path, category)
+                    self._ensure_dir(category_path)
+                    self.set_folder_icon_and_color(category_path, category)
                             
-                            # Update/create each category folder
-                            for category, info in self.categories.items():
-                                category_path = os.path.join(dated_path, category)
-                                os.makedirs(category_path, exist_ok=True)
-                                
-                                # Set folder icon and color
-                                ini_path = os.path.join(category_path, "Desktop.ini")
-                                with open(ini_path, 'w', encoding='utf-8') as f:
-                                    f.write("[.ShellClassInfo]\n")
-                                    if category == "Audio":
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,137\n")
-                                        f.write("BackgroundColor=144 238 144\n")  # Light green
-                                    elif category == "Documents":
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,21\n")
-                                        f.write("BackgroundColor=255 232 186\n")  # Light yellow
-                                    elif category == "Images":
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,140\n")
-                                        f.write("BackgroundColor=173 216 230\n")  # Light blue
-                                    # ... (add other categories as needed)
-                                
-                                # Set folder attributes
-                                ctypes.windll.kernel32.SetFileAttributesW(ini_path, 0x2 | 0x4)
-                                ctypes.windll.kernel32.SetFileAttributesW(category_path, 0x1)
-                                
         except Exception as e:
             print(f"Error updating OneDrive archive: {e}")  # Direct console output
             logging.error(f"Error updating OneDrive archive: {e}")
@@ -495,17 +692,18 @@ class FileOrganizer:
     def move_shortcuts(self, folder_path: str) -> None:
         """Move all shortcuts to a dedicated folder."""
         try:
-            timestamp = datetime.datetime.now().strftime("%b-%d-%Y_%I-%M%p")
+            timestamp = self._session_ts
             archive_path = os.path.join(folder_path, "Archive", timestamp)
             shortcuts_path = os.path.join(archive_path, "Shortcuts")
-            os.makedirs(shortcuts_path, exist_ok=True)
+            self._ensure_dir(shortcuts_path)
             
-            for item in os.listdir(folder_path):
-                if item.lower().endswith(('.lnk', '.url', '.desktop')):
-                    source = os.path.join(folder_path, item)
-                    target = os.path.join(shortcuts_path, item)
-                    shutil.move(source, target)
-                    logging.info(f"Moved shortcut: {item}")
+            with os.scandir(folder_path) as it:
+                for entry in it:
+                    item = entry.name
+                    if _is_shortcut(item):
+                        target = os.path.join(shortcuts_path, item)
+                        if _move_new(entry.path, target):
+                            logging.debug("Moved shortcut: %s", item)
         except Exception as e:
             logging.error(f"Failed to move shortcuts: {e}")
 
@@ -513,14 +711,11 @@ class FileOrganizer:
         """Update all existing archive folders."""
         try:
             archive_path = os.path.join(root_path, "Archive")
-            if os.path.exists(archive_path):
-                for dated_folder in os.listdir(archive_path):
-                    dated_path = os.path.join(archive_path, dated_folder)
-                    if os.path.isdir(dated_path):
-                        for category in self.categories.keys():
-                            category_path = os.path.join(dated_path, category)
-                            os.makedirs(category_path, exist_ok=True)
-                            self.set_folder_icon_and_color(category_path, category)
+            for dated_path, _ in self._iter_dated_archive_folders([archive_path]):
+                for category in self._category_names:
+                    category_path = os.path.join(dated_path, category)
+                    self._ensure_dir(category_path)
+                    self.set_folder_icon_and_color(category_path, category)
         except Exception as e:
             logging.error(f"Failed to update existing archives: {e}")
 
@@ -528,132 +723,216 @@ class FileOrganizer:
         """Set folder icon and color."""
         try:
             ini_path = os.path.join(folder_path, "Desktop.ini")
-            with open(ini_path, 'w', encoding='utf-8') as f:
-                f.write("[.ShellClassInfo]\n")
-                if category == "Audio":
-                    f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,137\n")
-                    f.write("BackgroundColor=144 238 144\n")  # Light green
-                elif category == "Documents":
-                    f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,21\n")
-                    f.write("BackgroundColor=255 232 186\n")  # Light yellow
-                elif category == "Images":
-                    f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,140\n")
-                    f.write("BackgroundColor=173 216 230\n")  # Light blue
-                elif category == "Shortcuts":
-                    f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,29\n")
-                    f.write("BackgroundColor=255 215 0\n")  # Gold
-                # Add other categories as needed
-
-            ctypes.windll.kernel32.SetFileAttributesW(ini_path, 0x2 | 0x4)
-            ctypes.windll.kernel32.SetFileAttributesW(folder_path, 0x1)
+            _write_desktop_ini(ini_path, category)
+
+            _ensure_attr(ini_path, 0x2 | 0x4)
+            _ensure_attr(folder_path, 0x1)
         except Exception as e:
             logging.error(f"Failed to set icon and color for {folder_path}: {e}")
 
     def fix_all_archives(self) -> None:
         """Fix all existing archives, including OneDrive archives"""
         try:
-            # List of all possible archive locations
-            archive_locations = []
-            
-            # Add OneDrive locations
-            onedrive_paths = [
-                os.path.join(os.path.expanduser('~'), 'OneDrive', 'Archive - Pre-2024'),
-                os.path.join(os.path.expanduser('~'), 'OneDrive - Business', 'Archive - Pre-2024')
-            ]
-            archive_locations.extend(onedrive_paths)
-            
-            # Add local archive locations
-            if self.desktop_path:
-                archive_locations.append(os.path.join(self.desktop_path, "Archive"))
-            if self.downloads_path:
-                archive_locations.append(os.path.join(self.downloads_path, "Archive"))
-
-            # Process each archive location
-            for archive_path in archive_locations:
-                if os.path.exists(archive_path):
-                    print(f"Fixing archive: {archive_path}")
-                    
-                    # Walk through all subfolders
-                    for root, dirs, files in os.walk(archive_path):
-                        # Check if this is a dated folder (contains underscore)
-                        if os.path.basename(root).count('_') > 0:
-                            print(f"Processing dated folder: {root}")
-                            
-                            # Ensure all category folders exist
-                            for category in self.categories.keys():
-                                category_path = os.path.join(root, category)
-                                os.makedirs(category_path, exist_ok=True)
-                                
-                                # Set correct icon and color
-                                ini_path = os.path.join(category_path, "Desktop.ini")
-                                with open(ini_path, 'w', encoding='utf-8') as f:
-                                    f.write("[.ShellClassInfo]\n")
-                                    
-                                    # Set category-specific icons and colors
-                                    if category == "Audio":
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,137\n")
-                                        f.write("BackgroundColor=144 238 144\n")  # Light green
-                                    elif category == "Documents":
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,21\n")
-                                        f.write("BackgroundColor=255 232 186\n")  # Light yellow
-                                    elif category == "Images":
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,140\n")
-                                        f.write("BackgroundColor=173 216 230\n")  # Light blue
-                                    elif category == "Video":
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,136\n")
-                                        f.write("BackgroundColor=255 182 193\n")  # Light pink
-                                    elif category == "Shortcuts":
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,29\n")
-                                        f.write("BackgroundColor=255 215 0\n")  # Gold
-                                    elif category == "Code":
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,70\n")
-                                        f.write("BackgroundColor=221 160 221\n")  # Purple
-                                    elif category == "Executables":
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,8\n")
-                                        f.write("BackgroundColor=255 160 122\n")  # Coral
-                                    elif category == "ZIP_Files":
-                                        f.write("IconResource=%SystemRoot%\\system32\\zipfldr.dll,0\n")
-                                        f.write("BackgroundColor=210 180 140\n")  # Tan
-                                    elif category == "RAR_Files":
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,165\n")
-                                        f.write("BackgroundColor=210 180 140\n")  # Tan
-                                    elif category == "Other_Archives":
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,165\n")
-                                        f.write("BackgroundColor=210 180 140\n")  # Tan
-                                    else:  # Others
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,234\n")
-                                        f.write("BackgroundColor=211 211 211\n")  # Light gray
-
-                                # Set proper attributes
-                                ctypes.windll.kernel32.SetFileAttributesW(ini_path, 0x2 | 0x4)  # Hidden | System
-                                ctypes.windll.kernel32.SetFileAttributesW(category_path, 0x1)  # Read-only
-                                
-                                # Move any misplaced files into correct categories
-                                for file in files:
-                                    file_path = os.path.join(root, file)
-                                    if os.path.isfile(file_path):
-                                        _, ext = os.path.splitext(file.lower())
-                                        target_category = self.get_category_for_extension(ext)
-                                        if target_category:
-                                            target_path = os.path.join(root, target_category, file)
-                                            if not os.path.exists(target_path):
-                                                shutil.move(file_path, target_path)
-                                                print(f"Moved {file} to {target_category}")
+            # Discover dated folders and fix each one on the thread pool
+            with concurrent.futures.ThreadPoolExecutor(max_workers=ARCHIVE_WORKERS) as pool:
+                futures = {pool.submit(self._fix_dated_folder, dated_path, files): dated_path
+                           for dated_path, files in self._iter_dated_archive_folders()}
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logging.error(f"Failed to fix {_display_path(futures[future])}: {e}")
+            self._save_manifest(self._all_archive_roots())
 
         except Exception as e:
             print(f"Error fixing archives: {e}")
             logging.error(f"Error fixing archives: {e}")
             logging.error(traceback.format_exc())
 
+    def _fix_dated_folder(self, root: str, files: list) -> None:
+        """Ensure category folders and icons in a dated folder and sort its files"""
+        logging.info(f"Processing dated folder: {_display_path(root)}")
+        if not files and self._dated_folder_unchanged(root):
+            return
+
+        # Ensure all category folders exist
+        cat_paths = {category: self._ensure_category_folder(root, category)
+                     for category in self._category_names}
+
+        # Move any misplaced files into correct categories
+        self._move_misplaced_files(root, cat_paths, [(entry.path, entry.name) for entry in files])
+        self._remember_dated_folder(root)
+
+    def _load_manifest(self) -> dict:
+        """Load the dated folders recorded as complete by previous runs with the same categories"""
+        try:
+            with open(self._manifest_path, 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(manifest, dict) or manifest.get("categories") != self._manifest_key:
+            return {}
+        return dict(manifest.get("folders", {}))
+
+    def _save_manifest(self, roots) -> None:
+        """Persist the completed dated folders, dropping ones under roots that this walk did not see"""
+        prefixes = tuple(os.path.join(os.path.normcase(root), '') for root in roots)
+        folders = {
+            path: mtime for path, mtime in list(self._manifest.items())
+            if path in self._seen_dated_folders or not os.path.normcase(path).startswith(prefixes)
+        }
+        try:
+            os.makedirs(os.path.dirname(self._manifest_path), exist_ok=True)
+            with open(self._manifest_path, 'w') as f:
+                json.dump({"categories": self._manifest_key, "folders": folders}, f)
+            self._manifest = folders
+        except OSError as e:
+            logging.warning(f"Failed to save archive manifest: {e}")
+
+    def _dated_folder_unchanged(self, dated_path: str) -> bool:
+        """Whether a dated folder is untouched since a previous run completed it and its
+        category folders are still intact"""
+        key = _display_path(dated_path)
+        self._seen_dated_folders.add(key)
+        try:
+            mtime = os.stat(dated_path).st_mtime_ns
+        except OSError:
+            return False
+        if self._manifest.get(key) != mtime:
+            return False
+
+        # Desktop.ini deletions and attribute resets leave the dated folder's mtime alone
+        return all(self._category_folder_intact(os.path.join(dated_path, category), category)
+                   for category in self._category_names)
+
+    def _category_folder_intact(self, category_path: str, category: str) -> bool:
+        """Whether a category folder still has its Desktop.ini and attributes (two stats, no writes)"""
+        try:
+            ini_stat = os.stat(os.path.join(category_path, "Desktop.ini"))
+            folder_stat = os.stat(category_path)
+        except OSError:
+            return False
+        if ini_stat.st_size != len(_DESKTOP_INI_BY_CATEGORY.get(category, _DEFAULT_DESKTOP_INI)):
+            return False
+
+        # File attributes only exist on Windows, where os.stat reports them for free
+        ini_attrs = getattr(ini_stat, 'st_file_attributes', 0x6)
+        folder_attrs = getattr(folder_stat, 'st_file_attributes', 0x1)
+        return ini_attrs & 0x6 == 0x6 and folder_attrs & 0x1 == 0x1
+
+    def _remember_dated_folder(self, dated_path: str) -> None:
+        """Record a dated folder as complete at its current mtime"""
+        key = _display_path(dated_path)
+        self._seen_dated_folders.add(key)
+        try:
+            self._manifest[key] = os.stat(dated_path).st_mtime_ns
+        except OSError:
+            pass
+
+    def _ensure_category_folder(self, parent: str, category: str) -> str:
+        """Create a category folder with its Desktop.ini and attributes, touching only what is missing"""
+        category_path = os.path.join(parent, category)
+
+        # Folders already styled during this run need no further I/O
+        if category_path in self._styled_folders:
+            return category_path
+        created = self._ensure_dir(category_path)
+
+        # A folder that was just created cannot have a Desktop.ini yet
+        ini_path = os.path.join(category_path, "Desktop.ini")
+        if not created and _desktop_ini_is_current(ini_path, category):
+            _ensure_attr(ini_path, 0x2 | 0x4)  # Hidden | System
+        else:
+            _write_desktop_ini(ini_path, category)
+            _SetFileAttributesW(ini_path, 0x2 | 0x4)  # Hidden | System
+        _ensure_attr(category_path, 0x1)  # Read-only
+        self._styled_folders.add(category_path)
+        return category_path
+
+    def _move_misplaced_files(self, dated_path: str, cat_paths: dict, files: list) -> None:
+        """Move (path, name) pairs into their category folders on the move pool"""
+        # Classify the whole batch up front with local lookups
+        ext_to_cat = self._ext_to_cat
+        categories = [ext_to_cat.get(_lower_ext(name), 'Others') for _, name in files]
+
+        # Categories missing from the config still get a real, styled folder
+        cat_paths = dict(cat_paths)
+        for category in set(categories).difference(cat_paths):
+            cat_paths[category] = self._ensure_category_folder(dated_path, category)
+
+        futures = {
+            _MOVE_POOL.submit(self._move_misplaced_file, source, cat_paths[category], name, category): name
+            for (source, name), category in zip(files, categories)
+        }
+
+        # Wait for this dated folder before moving on to the next one
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logging.error(f"Failed to move {futures[future]}: {e}")
+
+    def _move_misplaced_file(self, source: str, category_path: str, name: str, category: str) -> None:
+        """Move one misplaced archive file into its category folder unless it is already there"""
+        if _move_new(source, os.path.join(category_path, name)):
+            logging.debug("Moved %s to %s", name, category)
+
+    def _home_onedrive_archives(self) -> list:
+        """OneDrive archive folders under the user's home directory"""
+        return [
+            os.path.join(self.home_path, 'OneDrive', 'Archive - Pre-2024'),
+            os.path.join(self.home_path, 'OneDrive - Business', 'Archive - Pre-2024')
+        ]
+
+    def _all_archive_roots(self) -> tuple:
+        """All archive locations (OneDrive and local), resolved once"""
+        if self._archive_roots is None:
+            candidates = self.get_onedrive_archives() + self._home_onedrive_archives()
+            if self.desktop_path:
+                candidates.append(os.path.join(self.desktop_path, "Archive"))
+            if self.downloads_path:
+                candidates.append(os.path.join(self.downloads_path, "Archive"))
+
+            roots = {}
+            for path in candidates:
+                roots.setdefault(os.path.normcase(os.path.abspath(path)), path)
+            self._archive_roots = tuple(roots.values())
+        return self._archive_roots
+
+    def _iter_dated_archive_folders(self, roots=None):
+        """Yield (dated_folder, files) for every dated folder in the archive roots"""
+        for archive_path in self._all_archive_roots() if roots is None else roots:
+            if os.path.isdir(archive_path):
+                logging.info(f"Processing archive: {archive_path}")
+                yield from self._walk_dated_folders(_long_path(archive_path))
+
+    def _walk_dated_folders(self, path: str):
+        """Yield (dated_folder, files) below path without entering dated folders"""
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError as e:
+            logging.warning(f"Failed to scan {_display_path(path)}: {e}")
+            return
+
+        # Dated folders contain an underscore (e.g. Nov-28-2024_06-24PM); only
+        # their top-level files matter, so never descend into their categories
+        if '_' in os.path.basename(path):
+            yield path, [entry for entry in entries
+                         if entry.is_file(follow_symlinks=False) and not self.is_system_file(entry.path, entry)]
+            return
+        for entry in entries:
+            # Category folders such as ZIP_Files also contain underscores; links
+            # are not followed so a link back to an ancestor cannot loop
+            try:
+                if entry.is_dir(follow_symlinks=False) and entry.name not in self.categories:
+                    yield from self._walk_dated_folders(entry.path)
+            except OSError as e:
+                logging.warning(f"Failed to walk {_display_path(entry.path)}: {e}")
+
     def get_category_for_extension(self, ext: str) -> str:
         """Get the appropriate category for a file extension"""
-        if ext in ['.lnk', '.url', '.desktop']:
-            return 'Shortcuts'
-        
-        for category, info in self.categories.items():
-            if ext in info['extensions']:
-                return category
-        return 'Others'
+        return self._ext_to_cat.get(ext, 'Others')
 
     def organize(self):
         """Main organization method"""
@@ -661,10 +940,6 @@ class FileOrganizer:
             print("Starting organization process...")
             logging.info("Starting organization process...")
             
-            # Fix OneDrive archives first
-            print("Fixing OneDrive archives...")
-            self.fix_onedrive_archives()
-            
             # Handle current organization
             if self.desktop_path:
                 print("Organizing Desktop...")
@@ -674,8 +949,8 @@ class FileOrganizer:
                 print("Organizing Downloads...")
                 self.organize_folder(self.downloads_path)
             
-            # Fix OneDrive archives again
-            print("Final OneDrive archive update...")
+            # Fix OneDrive archives once everything else is in place
+            print("Fixing OneDrive archives...")
             self.fix_onedrive_archives()
             
             print("Organization complete!")
@@ -697,89 +972,57 @@ class FileOrganizer:
     def fix_onedrive_archives(self) -> None:
         """Fix OneDrive archives specifically"""
         try:
-            # OneDrive paths with full structure
-            onedrive_paths = [
-                os.path.join(os.path.expanduser('~'), 'OneDrive', 'Archive - Pre-2024', 'Desktop', 'Archive'),
-                os.path.join(os.path.expanduser('~'), 'OneDrive', 'Archive - Pre-2024', 'Downloads', 'Archive'),
-                os.path.join(os.path.expanduser('~'), 'OneDrive - Business', 'Archive - Pre-2024', 'Desktop', 'Archive'),
-                os.path.join(os.path.expanduser('~'), 'OneDrive - Business', 'Archive - Pre-2024', 'Downloads', 'Archive')
-            ]
-
-            for archive_path in onedrive_paths:
-                if os.path.exists(archive_path):
-                    print(f"Processing OneDrive archive: {archive_path}")
-                    
-                    # Process each dated folder
-                    for dated_folder in os.listdir(archive_path):
-                        dated_path = os.path.join(archive_path, dated_folder)
-                        if os.path.isdir(dated_path) and '_' in dated_folder:
-                            print(f"Fixing dated folder: {dated_folder}")
-                            
-                            # Ensure all category folders exist with correct icons
-                            for category in self.categories.keys():
-                                category_path = os.path.join(dated_path, category)
-                                os.makedirs(category_path, exist_ok=True)
-                                
-                                # Set icon and color
-                                ini_path = os.path.join(category_path, "Desktop.ini")
-                                with open(ini_path, 'w', encoding='utf-8') as f:
-                                    f.write("[.ShellClassInfo]\n")
-                                    
-                                    if category == "Audio":
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,137\n")
-                                        f.write("BackgroundColor=144 238 144\n")  # Light green
-                                    elif category == "Documents":
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,21\n")
-                                        f.write("BackgroundColor=255 232 186\n")  # Light yellow
-                                    elif category == "Images":
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,140\n")
-                                        f.write("BackgroundColor=173 216 230\n")  # Light blue
-                                    elif category == "Video":
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,136\n")
-                                        f.write("BackgroundColor=255 182 193\n")  # Light pink
-                                    elif category == "Shortcuts":
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,29\n")
-                                        f.write("BackgroundColor=255 215 0\n")  # Gold
-                                    elif category == "Code":
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,70\n")
-                                        f.write("BackgroundColor=221 160 221\n")  # Purple
-                                    elif category == "Executables":
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,8\n")
-                                        f.write("BackgroundColor=255 160 122\n")  # Coral
-                                    elif category == "ZIP_Files":
-                                        f.write("IconResource=%SystemRoot%\\system32\\zipfldr.dll,0\n")
-                                        f.write("BackgroundColor=210 180 140\n")  # Tan
-                                    elif category == "RAR_Files":
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,165\n")
-                                        f.write("BackgroundColor=210 180 140\n")  # Tan
-                                    elif category == "Other_Archives":
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,165\n")
-                                        f.write("BackgroundColor=210 180 140\n")  # Tan
-                                    else:  # Others
-                                        f.write("IconResource=%SystemRoot%\\system32\\SHELL32.dll,234\n")
-                                        f.write("BackgroundColor=211 211 211\n")  # Light gray
-
-                                # Set attributes
-                                ctypes.windll.kernel32.SetFileAttributesW(ini_path, 0x2 | 0x4)  # Hidden | System
-                                ctypes.windll.kernel32.SetFileAttributesW(category_path, 0x1)  # Read-only
-
-                                # Move any misplaced files
-                                for item in os.listdir(dated_path):
-                                    if os.path.isfile(os.path.join(dated_path, item)):
-                                        _, ext = os.path.splitext(item.lower())
-                                        target_category = self.get_category_for_extension(ext)
-                                        if target_category:
-                                            source = os.path.join(dated_path, item)
-                                            target = os.path.join(dated_path, target_category, item)
-                                            if not os.path.exists(target):
-                                                shutil.move(source, target)
-                                                print(f"Moved {item} to {target_category}")
+            # Scan and style dated folders on the scan pool; each worker feeds
+            # its moves to the move pool and waits for them, which bounds the backlog
+            with concurrent.futures.ThreadPoolExecutor(max_workers=DIR_SCAN_WORKERS) as pool:
+                futures = {}
+                for archive_path in self._onedrive_roots:
+                    if os.path.exists(archive_path):
+                        print(f"Processing OneDrive archive: {archive_path}")
+
+                        with os.scandir(archive_path) as it:
+                            for entry in it:
+                                if '_' in entry.name and entry.is_dir():
+                                    futures[pool.submit(self._fix_onedrive_dated_folder, entry.path)] = entry.path
+
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logging.error(f"Failed to fix {futures[future]}: {e}")
+            self._save_manifest(self._onedrive_roots)
 
         except Exception as e:
             print(f"Error fixing OneDrive archives: {e}")
             logging.error(f"Error fixing OneDrive archives: {e}")
             logging.error(traceback.format_exc())
 
+    def _fix_onedrive_dated_folder(self, dated_path: str) -> None:
+        """Ensure category folders and icons in a OneDrive dated folder and sort its files"""
+        logging.info(f"Fixing dated folder: {os.path.basename(dated_path)}")
+
+        # One enumeration feeds both the category folders and the misplaced files
+        misplaced = []
+        with os.scandir(dated_path) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    # desktop.ini, Thumbs.db and friends stay where Explorer put them
+                    if not self.is_system_file(entry.path, entry):
+                        misplaced.append((entry.path, entry.name))
+                elif entry.name in self.categories and entry.is_dir():
+                    # Existing category folders need no makedirs
+                    self._ensured_dirs.add(entry.path)
+        if not misplaced and self._dated_folder_unchanged(dated_path):
+            return
+
+        # Ensure all category folders exist with correct icons
+        cat_paths = {category: self._ensure_category_folder(dated_path, category)
+                     for category in self._category_names}
+
+        # Move any misplaced files once every category folder exists
+        self._move_misplaced_files(dated_path, cat_paths, misplaced)
+        self._remember_dated_folder(dated_path)
+
 class FileOrganizerGUI:
     def __init__(self):
         """Initialize the GUI with custom styling"""
@@ -1062,15 +1305,18 @@ class FileOrganizerGUI:
             def run_organizer():
                 try:
                     organizer = FileOrganizer()
-                    for folder in selected_folders:
+
+                    def resolve_folder(folder):
                         if folder == 'Workspaces':
-                            workspace_path = os.path.join(os.path.expanduser('~'), 'Workspaces')
-                            if os.path.exists(workspace_path):
-                                organizer.organize_folder(workspace_path)
-                        else:
-                            folder_path = organizer.get_special_folder_path(folder)
-                            if folder_path:
-                                organizer.organize_folder(folder_path)
+                            workspace_path = os.path.join(organizer.home_path, 'Workspaces')
+                            return workspace_path if os.path.exists(workspace_path) else None
+                        return organizer.get_special_folder_path(folder)
+
+                    # Resolve every selected folder up front, overlapping the Shell lookups
+                    folder_paths = list(_MOVE_POOL.map(resolve_folder, selected_folders))
+                    for folder_path in folder_paths:
+                        if folder_path:
+                            organizer.organize_folder(folder_path)
                     
                     organizer.fix_onedrive_archives()
                     
@@ -1126,9 +1372,6 @@ class FileOrganizerGUI:
 
 def create_startup_shortcut():
     if sys.platform == 'win32':
-        import winreg
-        import os
-        
         # Get the path to the script
         script_path = os.path.abspath(sys.argv[0])
         
@@ -1147,22 +1390,15 @@ def main():
         if sys.platform == 'win32':
             # Hide console window on Windows
             try:
-                import win32gui
-                import win32con
+                if win32gui is None:
+                    raise ImportError("pywin32 is not installed")
                 hwnd = win32gui.GetForegroundWindow()
                 win32gui.ShowWindow(hwnd, win32con.SW_HIDE)
             except Exception as e:
                 logging.error(f"Failed to hide console: {e}")
 
         # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('file_organizer.log'),
-                logging.StreamHandler()
-            ]
-        )
+        _setup_logging()
         
         # Create startup shortcut
         create_startup_shortcut()
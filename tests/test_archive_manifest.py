@@ -0,0 +1,59 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+os.environ.setdefault('PYSTRAY_BACKEND', 'dummy')
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+try:
+    import File_Organizer
+except ImportError as e:  # GUI dependencies (Pillow, pystray, tkinter) not installed
+    raise unittest.SkipTest(f"File_Organizer cannot be imported: {e}")
+
+
+class ArchiveManifestTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.home = self.tmp.name
+        env = {'HOME': self.home, 'USERPROFILE': self.home,
+               'LOCALAPPDATA': os.path.join(self.home, 'AppData', 'Local')}
+        patcher = mock.patch.dict(os.environ, env)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        cwd = os.getcwd()
+        os.chdir(self.home)
+        self.addCleanup(os.chdir, cwd)
+        self.addCleanup(self.tmp.cleanup)
+
+        self.dated = os.path.join(self.home, 'OneDrive', 'Archive - Pre-2024',
+                                  'Downloads', 'Archive', 'Jan-01-2023_10-00AM')
+        os.makedirs(self.dated)
+
+    def _organizer(self):
+        return File_Organizer.FileOrganizer(os.path.join(REPO_ROOT, 'config.json'))
+
+    def test_loose_desktop_ini_does_not_block_manifest_skip(self):
+        # Explorer and OneDrive leave their own desktop.ini in dated folders
+        with open(os.path.join(self.dated, 'desktop.ini'), 'w') as f:
+            f.write('[.ShellClassInfo]\n')
+        with open(os.path.join(self.dated, 'report.docx'), 'w') as f:
+            f.write('report')
+
+        self._organizer().fix_onedrive_archives()
+        self.assertTrue(os.path.exists(os.path.join(self.dated, 'Documents', 'report.docx')))
+        self.assertTrue(os.path.exists(os.path.join(self.dated, 'desktop.ini')))
+
+        organizer = self._organizer()
+        with mock.patch.object(organizer, '_ensure_category_folder',
+                               wraps=organizer._ensure_category_folder) as ensure:
+            organizer.fix_onedrive_archives()
+        ensure.assert_not_called()
+        self.assertTrue(os.path.exists(os.path.join(self.dated, 'desktop.ini')))
+
+
+if __name__ == '__main__':
+    unittest.main()